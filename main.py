@@ -1,24 +1,34 @@
+import argparse
 import os
 import sys
-import time
 
-from src.bot_generation import generate_and_save_bot_ships
-from src.gameplay import GameState, ask_player_for_move
-from src.ship_input import get_and_save_player_ships
+# Each subcommand imports its modules inside its handler so that short runs
+# (validate-fleets, replay) don't pay for the game loop, simulation or bench code.
 
 
-def main():
+def cmd_play(args) -> None:
+    import time
+
+    from src.bot_generation import generate_and_save_bot_ships
+    from src.gameplay import GameState, ask_player_for_move
+    from src.ship_input import get_and_save_player_ships
+    from src.utils import make_rng, new_seed
+
     os.makedirs("data", exist_ok=True)
     os.makedirs("outputs", exist_ok=True)
 
-    print("Welcome to Battleship!")
-    player_ships = get_and_save_player_ships(csv_path="data/player_ships.csv")
-    bot_ships = generate_and_save_bot_ships(csv_path="data/bot_ships.csv")
+    seed = args.seed if args.seed is not None else new_seed()
 
-    game_state = GameState.from_fleets(player_ships, bot_ships)
-    game_state.init_log(csv_path="data/game_state.csv")
+    print("Welcome to Battleship!")
+    print(f"Game seed: {seed}")
 
     try:
+        player_ships = get_and_save_player_ships(csv_path="data/player_ships.csv")
+        bot_ships = generate_and_save_bot_ships(csv_path="data/bot_ships.csv", rng=make_rng(seed, "fleet"))
+
+        game_state = GameState.from_fleets(player_ships, bot_ships, seed)
+        game_state.init_log(csv_path="data/game_state.csv")
+
         while True:
             game_state.print_boards()
 
@@ -63,10 +73,118 @@ def main():
                     print("Bot hit! Bot gets extra shot.")
                     time.sleep(0.8)
 
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, EOFError):
         print("\nInterrupted. Exiting.")
         sys.exit(0)
 
 
+def cmd_simulate(args) -> None:
+    from src.simulation import simulate_games, write_results_csv
+    from src.utils import new_seed
+
+    root_seed = args.seed if args.seed is not None else new_seed()
+    results = simulate_games(args.games, root_seed, workers=args.workers, log_dir=args.log_dir)
+
+    if args.out:
+        write_results_csv(args.out, results)
+
+    player_wins = sum(1 for res in results if res["winner"] == "player")
+    avg_moves = sum(res["moves"] for res in results) / len(results) if results else 0.0
+    print(f"Root seed: {root_seed}")
+    print(f"Games: {len(results)} | player wins: {player_wins} | bot wins: {len(results) - player_wins}")
+    print(f"Average moves per game: {avg_moves:.1f}")
+
+
+def cmd_bench(args) -> None:
+    from src.bench import print_startup_bench, run_startup_bench
+
+    try:
+        results = run_startup_bench(repeats=args.repeats)
+    except RuntimeError as e:
+        print(f"Bench failed: {e}")
+        sys.exit(1)
+    print_startup_bench(results)
+
+
+def cmd_replay(args) -> None:
+    from src.replay import replay_game
+
+    try:
+        ok, msg = replay_game(args.log, player_ships_csv=args.player_ships, bot_ships_csv=args.bot_ships)
+    except (OSError, KeyError, ValueError, IndexError) as e:
+        print(f"Replay failed: {e}")
+        sys.exit(1)
+    if not ok:
+        print(f"Replay mismatch: {msg}")
+        sys.exit(1)
+    print("Replay matches the log move for move.")
+
+
+def cmd_validate_fleets(args) -> None:
+    from src.utils import read_ships_csv, validate_ship_fleet
+
+    all_ok = True
+    for path in args.files:
+        try:
+            ok, msg = validate_ship_fleet(read_ships_csv(path))
+        except (OSError, KeyError, ValueError, IndexError) as e:
+            ok, msg = False, f"could not read fleet ({e})"
+        all_ok = all_ok and ok
+        print(f"{path}: {'OK' if ok else f'invalid: {msg}'}")
+
+    if not all_ok:
+        sys.exit(1)
+
+
+def positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Terminal Battleship.")
+    sub = parser.add_subparsers(dest="command")
+
+    p = sub.add_parser("play", help="play an interactive game against the bot (default)")
+    p.add_argument("--seed", type=int, default=None, help="seed for bot fleet and bot moves")
+    p.set_defaults(func=cmd_play)
+
+    p = sub.add_parser("simulate", help="run headless games: random shooter vs bot")
+    p.add_argument("--games", type=int, default=100)
+    p.add_argument("--seed", type=int, default=None, help="root seed; per-game seeds are derived from it")
+    p.add_argument("--workers", type=int, default=1, help="worker processes (1 = run in-process)")
+    p.add_argument("--log-dir", default=None, help="write per-game logs and fleets here for replay")
+    p.add_argument("--out", default=None, help="write per-game results CSV")
+    p.set_defaults(func=cmd_simulate)
+
+    p = sub.add_parser("bench", help="measure import and launch time of each subcommand")
+    p.add_argument("--repeats", type=positive_int, default=5, help="timed launches per subcommand")
+    p.set_defaults(func=cmd_bench)
+
+    p = sub.add_parser("replay", help="re-run a logged game from its seed and verify it")
+    p.add_argument("log", nargs="?", default="data/game_state.csv")
+    p.add_argument("--player-ships", default="data/player_ships.csv")
+    p.add_argument("--bot-ships", default=None, help="also check the saved bot fleet against the one rebuilt from the seed")
+    p.set_defaults(func=cmd_replay)
+
+    p = sub.add_parser("validate-fleets", help="check ship CSV files against the fleet rules")
+    p.add_argument("files", nargs="+")
+    p.set_defaults(func=cmd_validate_fleets)
+
+    return parser
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv:
+        argv = ["play"]
+
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,92 @@
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+MAIN_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+
+
+def _run(cmd: List[str], cwd: str) -> Tuple[float, str]:
+    start = time.perf_counter()
+    proc = subprocess.run(
+        cmd,
+        cwd=cwd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+
+    if proc.returncode != 0:
+        output = [
+            line for line in (proc.stdout + proc.stderr).splitlines()
+            if line.strip() and not line.startswith("import time:")
+        ]
+        detail = output[-1] if output else "no output"
+        raise RuntimeError(f"{' '.join(cmd)} exited with {proc.returncode}: {detail}")
+    return elapsed, proc.stderr
+
+
+def _import_seconds(importtime_log: str) -> float:
+    # sum the cumulative time of top-level imports (no indent before the module name)
+    total_us = 0
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        if parts[2].startswith("  "):
+            continue
+        total_us += int(parts[1])
+    return total_us / 1_000_000
+
+
+def _launch_cases(work_dir: str) -> Dict[str, List[str]]:
+    return {
+        # play stops at the first fleet prompt (stdin is empty) and exits cleanly
+        "play": ["play", "--seed", "1"],
+        "simulate": ["simulate", "--games", "1", "--seed", "1", "--log-dir", work_dir],
+        "replay": [
+            "replay",
+            os.path.join(work_dir, "game_1.csv"),
+            "--player-ships", os.path.join(work_dir, "player_ships_1.csv"),
+            "--bot-ships", os.path.join(work_dir, "bot_ships_1.csv"),
+        ],
+        "validate-fleets": [
+            "validate-fleets",
+            os.path.join(work_dir, "player_ships_1.csv"),
+            os.path.join(work_dir, "bot_ships_1.csv"),
+        ],
+    }
+
+
+def _measure(args: List[str], work_dir: str, repeats: int) -> Tuple[float, float]:
+    # import time comes from -X importtime on the real launch, so it covers
+    # exactly what the handler pulls in; wall time is measured without it
+    _, log = _run([sys.executable, "-X", "importtime"] + args, work_dir)
+    launches = [_run([sys.executable] + args, work_dir)[0] for _ in range(repeats)]
+    return _import_seconds(log), statistics.median(launches)
+
+
+def run_startup_bench(repeats: int = 5) -> List[Tuple[str, float, float]]:
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        results.append(("(python)",) + _measure(["-c", "pass"], work_dir, repeats))
+
+        cases = _launch_cases(work_dir)
+        # replay and validate-fleets read the files simulate writes, so simulate goes first
+        for name in ["simulate", "play", "replay", "validate-fleets"]:
+            results.append((name,) + _measure([MAIN_PATH] + cases[name], work_dir, repeats))
+
+    return results
+
+
+def print_startup_bench(results: List[Tuple[str, float, float]]) -> None:
+    print(f"{'command':<18}{'import ms':>12}{'launch ms':>12}")
+    for name, imp, launch in results:
+        print(f"{name:<18}{imp * 1000:>12.1f}{launch * 1000:>12.1f}")
@@ -1,7 +1,7 @@
 import csv
 import os
 import random
-from typing import List
+from typing import List, Optional
 
 from src.utils import (
     BOARD_SIZE,
@@ -14,35 +14,38 @@ from src.utils import (
 )
 
 
-def _rand_orientation() -> str:
-    return random.choice(["horizontal", "vertical"])
+def _rand_orientation(rng: random.Random) -> str:
+    return rng.choice(["horizontal", "vertical"])
 
 
-def _build_ship(size: int) -> Ship:
+def _build_ship(size: int, rng: random.Random) -> Ship:
     while True:
-        orient = _rand_orientation()
+        orient = _rand_orientation(rng)
 
         if orient == "horizontal":
-            r = random.randint(0, BOARD_SIZE - 1)
-            c = random.randint(0, BOARD_SIZE - size)
+            r = rng.randint(0, BOARD_SIZE - 1)
+            c = rng.randint(0, BOARD_SIZE - size)
             ship = [(r, c + i) for i in range(size)]
         else:
-            r = random.randint(0, BOARD_SIZE - size)
-            c = random.randint(0, BOARD_SIZE - 1)
+            r = rng.randint(0, BOARD_SIZE - size)
+            c = rng.randint(0, BOARD_SIZE - 1)
             ship = [(r + i, c) for i in range(size)]
 
         if all(in_bounds(x) for x in ship):
             return ship
 
 
-def generate_bot_ships() -> List[Ship]:
+def generate_bot_ships(rng: Optional[random.Random] = None) -> List[Ship]:
+    if rng is None:
+        rng = random.Random()
+
     while True:
         ships: List[Ship] = []
 
         for size in SHIP_SIZES:
             # try a bunch of placements for this ship
             for _ in range(5000):
-                candidate = _build_ship(size)
+                candidate = _build_ship(size, rng)
                 if not ships_touch_or_overlap(ships + [candidate]):
                     ships.append(candidate)
                     break
@@ -58,8 +61,11 @@ def generate_bot_ships() -> List[Ship]:
             return ships
 
 
-def generate_and_save_bot_ships(csv_path: str = "data/bot_ships.csv") -> List[Ship]:
-    ships = generate_bot_ships()
+def generate_and_save_bot_ships(
+    csv_path: str = "data/bot_ships.csv",
+    rng: Optional[random.Random] = None,
+) -> List[Ship]:
+    ships = generate_bot_ships(rng)
 
     os.makedirs(os.path.dirname(csv_path), exist_ok=True)
     with open(csv_path, mode="w", newline="") as f:
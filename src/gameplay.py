@@ -1,6 +1,5 @@
 import csv
 import os
-import random
 from typing import List, Optional, Tuple
 
 from src.utils import (
@@ -13,6 +12,8 @@ from src.utils import (
     coords_to_str,
     get_adjacent_and_diagonal_cells,
     in_bounds,
+    make_rng,
+    new_seed,
 )
 
 
@@ -21,7 +22,11 @@ class GameState:
     HUNT = "hunt"
     LOCKED = "locked"
 
-    def __init__(self, player_ships: List[Ship], bot_ships: List[Ship]):
+    def __init__(self, player_ships: List[Ship], bot_ships: List[Ship], seed: Optional[int] = None):
+        # every bot decision draws from this stream so a game can be replayed from its seed
+        self.seed = seed if seed is not None else new_seed()
+        self.rng = make_rng(self.seed, "bot")
+
         self.turn_number = 1
         self.move_number = 0
 
@@ -47,8 +52,8 @@ class GameState:
         self._last_move: Optional[Tuple[int, int, str, str]] = None  # (r,c, result, who)
 
     @staticmethod
-    def from_fleets(player_fleet: List[Ship], bot_fleet: List[Ship]) -> "GameState":
-        return GameState(player_fleet, bot_fleet)
+    def from_fleets(player_fleet: List[Ship], bot_fleet: List[Ship], seed: Optional[int] = None) -> "GameState":
+        return GameState(player_fleet, bot_fleet, seed)
 
     def init_log(self, csv_path: str) -> None:
         self._log_path = csv_path
@@ -63,6 +68,7 @@ class GameState:
                 "result",
                 "player_board_serialized",
                 "bot_board_serialized",
+                "seed",
             ])
 
     def serialize_board(self, board: List[List[str]]) -> str:
@@ -84,6 +90,7 @@ class GameState:
                 result,
                 self.serialize_board(self.player_board),
                 self.serialize_board(self.bot_board),
+                self.seed,
             ])
 
     def _create_ship_board(self, ships: List[Ship]) -> List[List[str]]:
@@ -191,7 +198,7 @@ class GameState:
                     if in_bounds((nr, nc)) and self.player_board[nr][nc] == UNKNOWN:
                         opts.append((nr, nc))
             if opts:
-                return random.choice(opts)
+                return self.rng.choice(opts)
             self.bot_mode = GameState.RANDOM
             return self._bot_random_pick()
 
@@ -209,7 +216,7 @@ class GameState:
                 if in_bounds(right) and self.player_board[right[0]][right[1]] == UNKNOWN:
                     candidates.append(right)
                 if candidates:
-                    return random.choice(candidates)
+                    return self.rng.choice(candidates)
             else:
                 c = hits[0][1]
                 rows = [r for r, _ in hits]
@@ -221,7 +228,7 @@ class GameState:
                 if in_bounds(down) and self.player_board[down[0]][down[1]] == UNKNOWN:
                     candidates.append(down)
                 if candidates:
-                    return random.choice(candidates)
+                    return self.rng.choice(candidates)
 
             self.bot_mode = GameState.HUNT
             return self._bot_choose_move()
@@ -234,7 +241,7 @@ class GameState:
             for c in range(BOARD_SIZE):
                 if self.player_board[r][c] == UNKNOWN:
                     choices.append((r, c))
-        return random.choice(choices)
+        return self.rng.choice(choices)
 
     def _infer_orientation(self):
         if len(self.bot_hit_chain) < 2:
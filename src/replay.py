@@ -0,0 +1,90 @@
+import csv
+from typing import List, Optional, Tuple
+
+from src.bot_generation import generate_bot_ships
+from src.gameplay import GameState
+from src.utils import make_rng, read_ships_csv, str_to_coords
+
+
+LOG_FIELDS = [
+    "move_number",
+    "turn_number",
+    "who",
+    "coord",
+    "result",
+    "player_board_serialized",
+    "bot_board_serialized",
+    "seed",
+]
+
+
+def read_game_log(csv_path: str) -> List[dict]:
+    rows = []
+    with open(csv_path, newline="") as f:
+        reader = csv.DictReader(f)
+        # logs written before seeds were recorded have no seed column; replay_game reports that
+        required = [name for name in LOG_FIELDS if name != "seed" or "seed" in (reader.fieldnames or [])]
+        for row in reader:
+            # csv.DictReader fills fields missing from a short row with None
+            missing = [name for name in required if row.get(name) is None]
+            if missing:
+                raise ValueError(f"{csv_path} line {reader.line_num}: missing {', '.join(missing)}")
+            rows.append(row)
+    return rows
+
+
+def replay_game(
+    log_path: str = "data/game_state.csv",
+    player_ships_csv: str = "data/player_ships.csv",
+    bot_ships_csv: Optional[str] = None,
+) -> Tuple[bool, str | None]:
+    rows = read_game_log(log_path)
+    if not rows:
+        return False, "Game log is empty."
+    if "seed" not in rows[0] or not rows[0]["seed"]:
+        return False, "Game log has no seed column."
+
+    seed = int(rows[0]["seed"])
+    player_ships = read_ships_csv(player_ships_csv)
+    bot_ships = generate_bot_ships(make_rng(seed, "fleet"))
+
+    if bot_ships_csv is not None and read_ships_csv(bot_ships_csv) != bot_ships:
+        return False, f"Bot fleet regenerated from seed {seed} does not match {bot_ships_csv}."
+
+    game_state = GameState.from_fleets(player_ships, bot_ships, seed)
+
+    for i, row in enumerate(rows):
+        move = row["move_number"]
+        if int(row["seed"]) != seed:
+            return False, f"Move {move}: seed changed mid-game."
+        if row["who"] != game_state.current_turn:
+            return False, f"Move {move}: expected {game_state.current_turn} to shoot, log has {row['who']}."
+        if int(row["turn_number"]) != game_state.turn_number:
+            return False, f"Move {move}: turn {game_state.turn_number}, log has {row['turn_number']}."
+
+        if row["who"] == "player":
+            coord, result = game_state.player_take_turn(str_to_coords(row["coord"])[0])
+            extra = game_state.player_gets_extra_shot
+        else:
+            coord, result = game_state.bot_take_turn()
+            extra = game_state.bot_gets_extra_shot
+
+        human = game_state.coord_to_human(coord)
+        if human != row["coord"] or result != row["result"]:
+            return False, f"Move {move}: replay gave {human} -> {result}, log has {row['coord']} -> {row['result']}."
+
+        if (
+            game_state.serialize_board(game_state.player_board) != row["player_board_serialized"]
+            or game_state.serialize_board(game_state.bot_board) != row["bot_board_serialized"]
+        ):
+            return False, f"Move {move}: boards differ from log."
+
+        if game_state.all_player_ships_sunk() or game_state.all_bot_ships_sunk():
+            if i != len(rows) - 1:
+                return False, f"Move {move}: game ended but log has {len(rows) - 1 - i} more row(s)."
+            break
+
+        if not extra:
+            game_state.next_turn()
+
+    return True, None
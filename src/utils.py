@@ -1,5 +1,7 @@
 import csv
+import hashlib
 import os
+import random
 from typing import List, Tuple
 
 BOARD_SIZE = 10
@@ -104,3 +106,30 @@ def write_ships_csv(csv_path: str, ships: List[Ship]) -> None:
         w.writerow(["ship_id", "size", "coordinates"])
         for ship_id, ship in enumerate(ships, start=1):
             w.writerow([ship_id, len(ship), coords_to_str(ship)])
+
+
+def read_ships_csv(csv_path: str) -> List[Ship]:
+    ships: List[Ship] = []
+    with open(csv_path, newline="") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            if not row.get("coordinates"):
+                raise ValueError(f"{csv_path} line {reader.line_num}: missing coordinates")
+            ships.append(str_to_coords(row["coordinates"]))
+    return ships
+
+
+def new_seed() -> int:
+    return random.SystemRandom().randrange(2**63)
+
+
+def derive_seed(root_seed: int, *keys) -> int:
+    # sha256 rather than hash(): str hashing is salted per process
+    h = hashlib.sha256(str(root_seed).encode())
+    for key in keys:
+        h.update(b"/" + str(key).encode())
+    return int.from_bytes(h.digest()[:8], "big")
+
+
+def make_rng(seed: int, stream: str) -> random.Random:
+    return random.Random(derive_seed(seed, stream))